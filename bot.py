@@ -9,7 +9,7 @@ bot = commands.Bot(command_prefix="!", intents=config.intents, case_insensitive=
 async def on_ready():
     print(f"✅ Logged in as {bot.user}")
 data.move_log = data.load_move_log()
-print(f"🔧 Move log: {data.move_log}")  
+print(f"🔧 Move log: {len(data.move_log)} moves")
 print("✅ Move log loaded successfully.")
 
 data.load_dummy_data_from_json("tiles.json")
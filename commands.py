@@ -8,24 +8,64 @@ from data import (
     format_tile_reveal_message,
     render_board_view,
     MoveLog,
-    save_move_log,
 )
-from datetime import datetime
+from datetime import datetime, timezone
+import heapq
+import re
 import time
 import json
 from pathlib import Path
 
-user_team_cooldowns = {}  # key: (user_id, team_id), value: last use timestamp
+cooldowns = {}  # key: team_id, value: {user_id: last use timestamp}
+cooldown_heap = []  # (expiry timestamp, team_id, user_id), soonest expiry first
 COOLDOWN_DURATION = 20 * 60  # 20 minutes in seconds
+MESSAGE_LIMIT = 1900  # stay under Discord's 2000 character cap when batching replies
+
+COORD_PATTERN = re.compile(r"\s*([A-Za-z])\s*,\s*(\d+)\s*$")  # e.g. "A,2" or "a, 2"
+
+refs_role_cache = {}  # key: guild id, value: that guild's "refs" role (or None)
+completed_board_cache = None  # (tiles.json mtime, rendered !completed_board message)
+
+def set_cooldown(user_id: int, team_id: int, now: float):
+    cooldowns.setdefault(team_id, {})[user_id] = now
+    heapq.heappush(cooldown_heap, (now + COOLDOWN_DURATION, team_id, user_id))
+
+def purge_expired_cooldowns(now: float):
+    # only looks at entries that are actually due instead of scanning every cooldown
+    while cooldown_heap and cooldown_heap[0][0] <= now:
+        _, team_id, user_id = heapq.heappop(cooldown_heap)
+        team_cooldowns = cooldowns.get(team_id, {})
+        ts = team_cooldowns.get(user_id)
+        # stale heap entry if the cooldown was reset or renewed in the meantime
+        if ts is not None and now - ts >= COOLDOWN_DURATION:
+            del team_cooldowns[user_id]
+            if not team_cooldowns:
+                del cooldowns[team_id]
+
+def get_refs_role(guild: discord.Guild):
+    if guild.id not in refs_role_cache:
+        refs_role_cache[guild.id] = discord.utils.get(guild.roles, name="refs")
+    return refs_role_cache[guild.id]
 
 def register_commands(bot: commands.Bot):
 
+    # the cached refs role goes stale whenever a guild's roles change
+    async def forget_refs_role(role):
+        refs_role_cache.pop(role.guild.id, None)
+
+    async def forget_refs_role_on_update(before, after):
+        refs_role_cache.pop(after.guild.id, None)
+
+    bot.add_listener(forget_refs_role, "on_guild_role_create")
+    bot.add_listener(forget_refs_role, "on_guild_role_delete")
+    bot.add_listener(forget_refs_role_on_update, "on_guild_role_update")
+
     @bot.command(name="select")
     async def select_tile(ctx, coord_str: str):
         now = time.time()  # get current time in seconds
         author_id = ctx.author.id
         team = get_user_team(author_id)
-        refs_role = discord.utils.get(ctx.guild.roles, name="refs")
+        refs_role = get_refs_role(ctx.guild)
         if refs_role:
             role_mention = refs_role.mention
         else:
@@ -36,28 +76,19 @@ def register_commands(bot: commands.Bot):
             return
 
         # Clean up expired cooldowns
-        expired_keys = [key for key, ts in user_team_cooldowns.items() if now - ts > COOLDOWN_DURATION]
-        for key in expired_keys:
-            del user_team_cooldowns[key]
-
-        # Check if ANY user in the team is still on cooldown
-        team_on_cooldown = any(
-            now - ts < COOLDOWN_DURATION
-            for (uid, tid), ts in user_team_cooldowns.items()
-            if tid == team.id
-        )
+        purge_expired_cooldowns(now)
 
-        if team_on_cooldown:
+        # Check if ANY user in the team is still on cooldown (empty teams are removed)
+        if team.id in cooldowns:
             await ctx.send("⏳ Your team has picked a tile already! Get to grinding!")
             return
 
         # parsing coordinate
-        try:
-            row_letter, col_number = coord_str.split(",")
-            coord = (row_letter.strip().upper(), int(col_number.strip()))
-        except Exception:
+        match = COORD_PATTERN.match(coord_str)
+        if not match:
             await ctx.send("❌ Invalid format. Use: `!select A,2`.")
             return
+        coord = (match.group(1).upper(), int(match.group(2)))
 
         tile = get_tile(team.board, coord)
         if not tile:
@@ -65,23 +96,21 @@ def register_commands(bot: commands.Bot):
             return
 
         if tile.revealed:
-            await ctx.send(f"⚠️ Tile {coord[0]}{coord[1]} has already been revealed!")
+            await ctx.send(f"⚠️ Tile {tile.coord_str} has already been revealed!")
             return
 
-        tile.revealed = True
-        data.move_log.append(
-            MoveLog(
-                team_id=team.id,
-                discord_id=ctx.author.id,
-                coord=coord,
-                timestamp=datetime.utcnow().isoformat()
-            )
+        data.set_revealed(team, tile, True)
+        move = MoveLog(
+            team_id=team.id,
+            discord_id=ctx.author.id,
+            coord=coord,
+            timestamp=datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
         )
-        
-        save_move_log()
+        data.add_move(move)
+        data.queue_save(move)
 
         # update cooldown
-        user_team_cooldowns[(author_id, team.id)] = now
+        set_cooldown(author_id, team.id, now)
 
         await ctx.send(f"{format_tile_reveal_message(tile, ctx.author.display_name)}\n\n|| {role_mention} ||")
 
@@ -91,29 +120,11 @@ def register_commands(bot: commands.Bot):
             await ctx.send("❌ You do not have permission to use this command.")
             return
 
-        score_map = {
-            1: 1,  # KC tile
-            2: 2,  # Unique
-            3: 3,  # Raid/NM
-            "bomb": 4  # Bomb
-        }
-
-        leaderboard = []
-
-        for team in data.teams:
-            data.apply_move_log_to_board(team)  # sync revealed tiles
-
-            score = 0
-            bomb_count = 0
-
-            for row in team.board:
-                for tile in row:
-                    if tile.revealed:
-                        score += score_map.get(tile.tile_type, 0)
-                        if tile.tile_type == "bomb":
-                            bomb_count += 1
-
-            leaderboard.append((team.id, score, bomb_count))
+        # scores are kept up to date as tiles are revealed/undone
+        leaderboard = [
+            (team.id, data.team_score[team.id], data.team_bombs[team.id])
+            for team in data.teams
+        ]
 
         leaderboard.sort(key=lambda x: x[1], reverse=True)
 
@@ -140,10 +151,18 @@ def register_commands(bot: commands.Bot):
             await ctx.send("ℹ️ No teams have been created yet.")
             return
 
+        # pack as many boards per message as fit, rather than one message per team
+        buffer = ""
         for team in data.teams:
             data.apply_move_log_to_board(team)
-            board_view = render_board_view(team.board, team.id)
-            await ctx.send(f"🧩 **Team {team.id} Board:**\n```\n{board_view}\n```")
+            board_view = data.render_team_board(team)
+            block = f"🧩 **Team {team.id} Board:**\n```\n{board_view}\n```\n"
+            if buffer and len(buffer) + len(block) > MESSAGE_LIMIT:
+                await ctx.send(buffer)
+                buffer = ""
+            buffer += block
+
+        await ctx.send(buffer)
 
     @bot.command(name="board")
     async def view_board(ctx):
@@ -152,7 +171,7 @@ def register_commands(bot: commands.Bot):
             await ctx.send("❌ You are not part of any team.")
             return
         
-        board_view = render_board_view(team.board, team.id)
+        board_view = data.render_team_board(team)
         await ctx.send(f"🧩 Here is your current board:\n```\n{board_view}\n```")
 
     @bot.command(name="team")
@@ -194,10 +213,11 @@ Admin-only commands:
 
         # collect cooldown info by team
         cooldowns_by_team = {}
-        for (user_id, team_id), timestamp in user_team_cooldowns.items():
-            remaining = int(COOLDOWN_DURATION - (now - timestamp))
-            if remaining > 0:
-                cooldowns_by_team.setdefault(team_id, []).append((user_id, remaining))
+        for team_id, team_cooldowns in cooldowns.items():
+            for user_id, timestamp in team_cooldowns.items():
+                remaining = int(COOLDOWN_DURATION - (now - timestamp))
+                if remaining > 0:
+                    cooldowns_by_team.setdefault(team_id, []).append((user_id, remaining))
 
         if not cooldowns_by_team:
             await ctx.send("✅ No teams are currently on cooldown.")
@@ -218,11 +238,7 @@ Admin-only commands:
             await ctx.send("❌ You do not have permission to use this command.")
             return
 
-        affected = 0
-        keys_to_remove = [key for key in user_team_cooldowns if key[1] == team_id]
-        for key in keys_to_remove:
-            del user_team_cooldowns[key]
-            affected += 1
+        affected = len(cooldowns.pop(team_id, {}))
 
         if affected == 0:
             await ctx.send(f"ℹ️ No active cooldowns found for team {team_id}.")
@@ -235,11 +251,19 @@ Admin-only commands:
             await ctx.send("❌ You do not have permission to use this command.")
             return
 
+        global completed_board_cache
+
         tile_path = Path("tiles.json")
         if not tile_path.exists():
             await ctx.send("❌ Could not find `tiles.json`.")
             return
 
+        # the base board only changes when tiles.json is edited
+        mtime = tile_path.stat().st_mtime
+        if completed_board_cache and completed_board_cache[0] == mtime:
+            await ctx.send(completed_board_cache[1])
+            return
+
         with open(tile_path, "r") as f:
             tile_data = json.load(f)
 
@@ -247,12 +271,13 @@ Admin-only commands:
         dummy_board = data.create_board_template_from_json(tile_data)
 
         # reveal all tiles
-        for row in dummy_board:
-            for tile in row:
-                tile.revealed = True
+        for tile in dummy_board:
+            tile.revealed = True
 
         board_text = render_board_view(dummy_board, team_id=0)
-        await ctx.send(f"🧩 **Base Board (All Tiles Revealed):**\n```\n{board_text}\n```")
+        message = f"🧩 **Base Board (All Tiles Revealed):**\n```\n{board_text}\n```"
+        completed_board_cache = (mtime, message)
+        await ctx.send(message)
 
 
     @bot.command(name="moves")
@@ -264,7 +289,7 @@ Admin-only commands:
                 return
 
             # look up the team by ID
-            team = next((t for t in data.teams if t.id == team_id), None)
+            team = data.teams_by_id.get(team_id)
             if not team:
                 await ctx.send("❌ Could not find a team with that ID.")
                 return
@@ -275,7 +300,7 @@ Admin-only commands:
                 await ctx.send("❌ You are not part of any team.")
                 return
 
-        team_moves = [m for m in data.move_log if m.team_id == team.id]
+        team_moves = data.move_log_by_team.get(team.id)
         if not team_moves:
             await ctx.send(f"🕳️ No moves made yet for Team `{team.id}`.")
             return
@@ -291,13 +316,12 @@ Admin-only commands:
             await ctx.send("❌ You don't have permission to use this command.")
             return
 
-        team_moves = [m for m in data.move_log if m.team_id == team_id]
-        if not team_moves:
+        last_move = data.get_last_move(team_id)
+        if not last_move:
             await ctx.send(f"❌ No moves found for team {team_id}.")
             return
 
-        last_move = team_moves[-1]
-        team = next((t for t in data.teams if t.id == team_id), None)
+        team = data.teams_by_id.get(team_id)
 
         if not team:
             await ctx.send(f"❌ No team found with ID {team_id}.")
@@ -305,13 +329,14 @@ Admin-only commands:
 
         tile = get_tile(team.board, last_move.coord)
         if tile:
-            tile.revealed = False
-            data.move_log.remove(last_move)
-            save_move_log()
-            await ctx.send(f"✅ Move undone for team {team_id} — {last_move.coord[0]}{last_move.coord[1]}")
-
-            board_view = render_board_view(team.board, team.id)
-            await ctx.send(f"🧩 Updated board:\n```\n{board_view}\n```")
+            data.set_revealed(team, tile, False)
+            data.remove_move(last_move)
+            data.queue_undo(last_move)
+            board_view = data.render_team_board(team)
+            await ctx.send(
+                f"✅ Move undone for team {team_id} — {last_move.coord[0]}{last_move.coord[1]}\n\n"
+                f"🧩 Updated board:\n```\n{board_view}\n```"
+            )
         else:
             await ctx.send("❌ Could not find the tile to undo.")
 
@@ -326,13 +351,11 @@ Admin-only commands:
         
         data.apply_move_log_to_board(team)
 
-        # get all moves for the team, sorted by timestamp
-        team_moves = [m for m in data.move_log if m.team_id == team.id]
-        if not team_moves:
+        last_move = data.get_last_move(team.id)
+        if not last_move:
             await ctx.send("ℹ️ Your team hasn't revealed any tiles yet.")
             return
 
-        last_move = team_moves[-1]
         tile = get_tile(team.board, last_move.coord)
         print(tile)
         if tile and tile.revealed:
@@ -350,28 +373,27 @@ Admin-only commands:
             await ctx.send("ℹ️ No teams have been created yet.")
             return
 
-        message = "**📋 Team Roster:**\n"
+        parts = ["**📋 Team Roster:**\n"]
 
         for team in data.teams:
-            message += f"\n**Team {team.id}**:\n"
+            parts.append(f"\n**Team {team.id}**:\n")
 
             if not team.members:
-                message += "  — No members\n"
+                parts.append("  — No members\n")
                 continue
 
             for member in team.members:
-                try:
-                    message += f"  • {member.rsn}\n"
-                except Exception:
-                    message += f"  • Unknown user (<@{member.discord_id}>)\n"
+                parts.append(f"  • {member.rsn}\n")
 
-        await ctx.send(message)
+        await ctx.send("".join(parts))
 
     @bot.command(name="hole")
     async def hole(ctx):
-        message = "Oh, are you seeking hole?\n\n"
-        message += "Here are some holes:\n"
-        message += "1. 🕳️\n"
+        message = (
+            "Oh, are you seeking hole?\n\n"
+            "Here are some holes:\n"
+            "1. 🕳️\n"
+        )
 
         await ctx.send(message)
 
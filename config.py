@@ -5,7 +5,8 @@ import discord
 load_dotenv()
 
 TOKEN = os.getenv("DISCORD_TOKEN")
-ADMIN_IDS = [int(x) for x in os.getenv("ADMIN_IDS").split(",")]
+# frozenset for quick membership checks; an unset ADMIN_IDS just means no admins
+ADMIN_IDS: frozenset[int] = frozenset(int(x) for x in os.getenv("ADMIN_IDS", "").split(",") if x.strip())
 
 intents = discord.Intents.default()
 intents.message_content = True
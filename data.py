@@ -1,17 +1,43 @@
 from __future__ import annotations
+import asyncio
+import atexit
+import bisect
 import json
+import logging
+import os
+import sys
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Union, Tuple, Literal, Optional
+from collections import defaultdict
+import functools
+from typing import Dict, List, NamedTuple, Set, Union, Tuple, Literal, Optional
 import random
 
+log = logging.getLogger(__name__)
+
 move_log: List[MoveLog] = []
+# same moves as move_log, bucketed by team_id (kept in sync by add_move/remove_move)
+move_log_by_team: Dict[int, List[MoveLog]] = defaultdict(list)
+# board indices each team has revealed according to move_log, as a bitmask (bit n = board[n]);
+# added to as moves come in, dropped on undo
+_revealed_cache: Dict[int, int] = {}
 # global team list to be populated from file data
 teams: List[Team] = []
+# lookup tables over `teams`, rebuilt whenever the teams are loaded
+teams_by_id: Dict[int, Team] = {}
+user_team_map: Dict[int, Team] = {}  # key: member discord id
+# bumped whenever any of a team's tiles is revealed or hidden again
+board_version: Dict[int, int] = defaultdict(int)
+# teams whose tiles haven't been synced with move_log yet. select/undo keep the
+# in-memory boards in sync themselves, so only (re)loading adds teams here
+team_board_dirty: Set[int] = set()
+# running leaderboard totals, updated as tiles are revealed or hidden
+team_score: Dict[int, int] = defaultdict(int)
+team_bombs: Dict[int, int] = defaultdict(int)
 
 # --- move log structure ---
-@dataclass
-class MoveLog:
+# moves and members never change once created, so plain named tuples are enough
+class MoveLog(NamedTuple):
     team_id: int
     discord_id: int
     coord: tuple[str, int]
@@ -21,7 +47,7 @@ class MoveLog:
         return {
             "team_id": self.team_id,
             "discord_id": self.discord_id,
-            "coord": list(self.coord),  # convert tuple to list for JSON
+            "coord": self.coord,  # json writes the tuple out as a list
             "timestamp": self.timestamp,
         }
 
@@ -30,13 +56,12 @@ class MoveLog:
         return cls(
             team_id=data["team_id"],
             discord_id=data["discord_id"],
-            coord=data["coord"],
+            coord=(data["coord"][0].upper(), data["coord"][1]),  # JSON gives a list back
             timestamp=data["timestamp"]
         )
 
 # --- team member structure ---
-@dataclass
-class Member:
+class Member(NamedTuple):
     rsn: str
     discord_id: int  
 
@@ -45,8 +70,23 @@ class Member:
 TileType = Union[Literal[1], Literal[2], Literal[3], Literal["bomb"]] # either 1, 2, 3 or "bomb"
 Coordinates = Tuple[str, int]  # e.g., ("A", 1)
 
+# the board is always 7x7, so work out the coordinates once
+ROW_LETTERS = ("A", "B", "C", "D", "E", "F", "G")
+BOARD_COORDS = tuple((row_letter, col_index + 1) for row_letter in ROW_LETTERS for col_index in range(7))
+BOARD_HEADER = "    1️⃣ 2️⃣ 3️⃣ 4️⃣ 5️⃣ 6️⃣ 7️⃣"  # column headers using number emojis
+# board index for each coordinate, so get_tile is one dict lookup (and anything off the board just misses)
+BOARD_INDEX: Dict[Coordinates, int] = {coord: index for index, coord in enumerate(BOARD_COORDS)}
+
+# points for each revealed tile, by tile type
+SCORE_MAP = {
+    1: 1,  # KC tile
+    2: 2,  # Unique
+    3: 3,  # Raid/NM
+    "bomb": 4  # Bomb
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Tile:
     coordinates: Coordinates
     tile_type: TileType
@@ -57,83 +97,236 @@ class Tile:
     notes: str
     description: str
     revealed: bool = False
+    coord_str: str = field(init=False, repr=False, compare=False)  # e.g. "A1", for messages
+
+    def __post_init__(self):
+        # tiles.json stores coordinates as lists; keep them as hashable tuples
+        self.coordinates = tuple(self.coordinates)
+        self.coord_str = f"{self.coordinates[0]}{self.coordinates[1]}"
 
 
 # --- team structure ---
-@dataclass
+@dataclass(slots=True)
 class Team:
     id: int
     members: List[Member]
-    board: List[List[Tile]] = field(default_factory=list)  # 7x7 grid
+    board: List[Tile] = field(default_factory=list)  # 7x7 grid stored flat, row by row (index row * 7 + col)
     
-move_log_file = Path("move_log.json")
+move_log_file = Path("move_log.jsonl")  # one JSON object per line, appended as moves come in
+
+FLUSH_DELAY = 0.5  # seconds to wait for more moves before writing them out
+FLUSH_BATCH_SIZE = 50  # write straight away once this many moves are waiting
+
+# compact one-line JSON; a single shared encoder so json.dumps doesn't build one per entry
+_encode_entry = json.JSONEncoder(separators=(",", ":")).encode
+
+_pending_writes: List[dict] = []
+_flush_task: Optional[asyncio.Task] = None  # set while a flush is waiting out FLUSH_DELAY
+_write_lock = asyncio.Lock()  # keeps appends from worker threads in order
+
+def save_move_log(filename=move_log_file, moves=None):
+    # full rewrite of the log, used to compact away undone moves
+    _pending_writes.clear()
+    # write to a temp file and swap it in, so a crash mid-write can't leave a half-written log
+    tmp_path = Path(filename).with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        f.writelines(_encode_entry(ml.to_dict()) + "\n" for ml in (move_log if moves is None else moves))
+    os.replace(tmp_path, filename)
+
+def _take_pending_writes() -> List[dict]:
+    global _pending_writes
+    entries, _pending_writes = _pending_writes, []
+    return entries
+
+def _append_entries(entries: List[dict], filename=move_log_file):
+    with open(filename, "a") as f:
+        f.writelines(_encode_entry(entry) + "\n" for entry in entries)
+
+def flush_pending_moves(filename=move_log_file):
+    # synchronous flush, for when there's no event loop left to hand the write to
+    entries = _take_pending_writes()
+    if entries:
+        _append_entries(entries, filename)
+
+async def _flush_after_delay(delay: float):
+    global _flush_task
+    await asyncio.sleep(delay)
+    _flush_task = None
+
+    # the file write runs in a worker thread so a slow disk doesn't stall the bot
+    async with _write_lock:
+        entries = _take_pending_writes()
+        if entries:
+            await asyncio.to_thread(_append_entries, entries)
+
+def _queue_write(entry: dict) -> None:
+    global _flush_task
+    _pending_writes.append(entry)
+    batch_full = len(_pending_writes) >= FLUSH_BATCH_SIZE
+    if _flush_task is None or batch_full:
+        if _flush_task is not None:
+            _flush_task.cancel()  # still sleeping, replace it with an immediate flush
+        delay = 0 if batch_full else FLUSH_DELAY
+        _flush_task = asyncio.get_running_loop().create_task(_flush_after_delay(delay))
+
+def queue_save(move: MoveLog) -> None:
+    """
+    queues a new move to be appended to the move log file. moves arriving close
+    together are written in one go instead of rewriting the file on every select.
+    """
+    _queue_write(move.to_dict())
 
-def save_move_log(filename=move_log_file):
-    with open(filename, "w") as f:
-        json.dump([ml.to_dict() for ml in move_log], f, indent=2)
+def queue_undo(move: MoveLog) -> None:
+    # undone moves stay in the file, followed by an {"undo": ...} line that cancels them on load
+    _queue_write({"undo": move.to_dict()})
+
+# don't lose queued moves if the bot is shut down inside the flush window
+atexit.register(flush_pending_moves)
 
 def load_move_log(filename=move_log_file):
+    global move_log_by_team
+    moves = []
+    undone = 0
     try:
         with open(filename, "r") as f:
-            data = json.load(f)
-            return [MoveLog.from_dict(m) for m in data]
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                if "undo" in entry:
+                    # drop the most recent matching move (compared as MoveLogs, so nothing gets re-serialized)
+                    undone_move = MoveLog.from_dict(entry["undo"])
+                    for i in range(len(moves) - 1, -1, -1):
+                        if moves[i] == undone_move:
+                            del moves[i]
+                            break
+                    undone += 1
+                else:
+                    moves.append(MoveLog.from_dict(entry))
     except FileNotFoundError:
-        return []
+        pass
+
+    # compact the file so undone moves don't pile up across restarts
+    if undone:
+        save_move_log(filename, moves)
+
+    # rebuild the per-team index for the freshly loaded log
+    move_log_by_team = defaultdict(list)
+    for move in moves:
+        move_log_by_team[move.team_id].append(move)
+    team_board_dirty.update(teams_by_id)
+    _revealed_cache.clear()
+    return moves
+
+def add_move(move: MoveLog) -> None:
+    move_log.append(move)
+    move_log_by_team[move.team_id].append(move)
+    # keep an already built revealed mask current instead of rebuilding it on the next render
+    mask = _revealed_cache.get(move.team_id)
+    index = BOARD_INDEX.get(move.coord)
+    if mask is not None and index is not None:
+        _revealed_cache[move.team_id] = mask | 1 << index
+
+def remove_move(move: MoveLog) -> None:
+    move_log.remove(move)
+    move_log_by_team[move.team_id].remove(move)
+    _revealed_cache.pop(move.team_id, None)
+
+def get_last_move(team_id: int) -> Optional[MoveLog]:
+    # moves are appended in order, so the tail of a team's bucket is its latest move
+    team_moves = move_log_by_team.get(team_id)
+    return team_moves[-1] if team_moves else None
+
+def moves_since(team_id: int, timestamp: str) -> List[MoveLog]:
+    """
+    returns the team's moves made at or after `timestamp` (an ISO-8601 string).
+    buckets are in append order and ISO timestamps sort as strings, so this is a
+    binary search rather than a scan over the team's whole history.
+    """
+    team_moves = move_log_by_team.get(team_id, [])
+    start = bisect.bisect_left(team_moves, timestamp, key=lambda move: move.timestamp)
+    return team_moves[start:]
 
 def get_user_team(discord_id: int) -> Optional[Team]:
-    for team in teams:
-        if any(member.discord_id == discord_id for member in team.members):
-            return team
-    return None
-
-def get_tile(board: List[List[Tile]], coord: tuple[str, int]) -> Optional[Tile]:
-    row_letter, col_number = coord
-    row_index = ord(row_letter.upper()) - ord("A")
-    col_index = col_number - 1
-
-    if 0 <= row_index < 7 and 0 <= col_index < 7:
-        return board[row_index][col_index]
-    return None
-
-def create_board_template_from_json(json_data: List[dict]) -> List[List[Tile]]:
-    layout = []
-    for row_index in range(7):
-        row_letter = chr(ord('A') + row_index)
-        row = []
-        for col_index in range(7):
-            # find the tile data for this coordinate (row, col)
-            tile_data = next((tile for tile in json_data if tile['coordinates'] == [row_letter, col_index + 1]), None)
-            if tile_data:
-                tile = Tile(
-                    coordinates=tile_data['coordinates'],
-                    tile_type=tile_data['tile_type'],
-                    drop_source=tile_data['drop_source'],
-                    drop=tile_data['drop'],
-                    alternative_drop=tile_data['alternative_drop'],
-                    count=tile_data['count'],
-                    notes=tile_data['notes'],
-                    description=tile_data['description'],
-                    revealed=tile_data['revealed'],
-                )
-            else:
-                # if no specific tile data is found, create a default tile
-                tile = Tile(
-                    coordinates=[row_letter, col_index + 1],
-                    tile_type=1,
-                    drop_source="General Graardor",
-                    drop="Bandos Chestplate",
-                    alternative_drop="",
-                    count=1,
-                    notes="",
-                    description="Kill count or unique item drop",
-                    revealed=False,
-                )
-            row.append(tile)
-        layout.append(row)
-    return layout
+    return user_team_map.get(discord_id)
+
+def register_team(team: Team) -> None:
+    """
+    adds a team after the initial load, keeping the lookup tables and the
+    team's board in step with everything else.
+    """
+    teams.append(team)
+    teams_by_id[team.id] = team
+    for member in team.members:
+        user_team_map[member.discord_id] = team
+
+    team_board_dirty.add(team.id)
+    apply_move_log_to_board(team)
+
+def get_tile(board: List[Tile], coord: tuple[str, int]) -> Optional[Tile]:
+    # coords are upper-cased on the way in (command parsing and MoveLog.from_dict)
+    index = BOARD_INDEX.get(coord)
+    if index is None:
+        return None
+    return board[index]
+
+def set_revealed(team: Team, tile: Tile, revealed: bool) -> None:
+    if tile.revealed == revealed:
+        return
+    tile.revealed = revealed
+    board_version[team.id] += 1
+
+    delta = 1 if revealed else -1
+    team_score[team.id] += delta * SCORE_MAP.get(tile.tile_type, 0)
+    if tile.tile_type == "bomb":
+        team_bombs[team.id] += delta
+
+# what an empty cell gets when tiles.json has nothing for that coordinate
+DEFAULT_TILE_FIELDS = {
+    "tile_type": 1,
+    "drop_source": "General Graardor",
+    "drop": "Bandos Chestplate",
+    "alternative_drop": "",
+    "count": 1,
+    "notes": "",
+    "description": "Kill count or unique item drop",
+    "revealed": False,
+}
+
+def index_tiles_by_coord(json_data: List[dict]) -> Dict[Coordinates, dict]:
+    # index the tile data by coordinate once instead of searching it for every cell
+    return {(tile['coordinates'][0], tile['coordinates'][1]): tile for tile in json_data}
+
+def create_board_template_from_json(json_data: Union[List[dict], Dict[Coordinates, dict]]) -> List[Tile]:
+    # takes tiles.json as loaded, or already indexed so several teams can share one index
+    by_coord = json_data if isinstance(json_data, dict) else index_tiles_by_coord(json_data)
+
+    tiles = []
+    for coord in BOARD_COORDS:
+        # find the tile data for this coordinate (row, col)
+        tile_data = by_coord.get(coord)
+        if tile_data:
+            # the same boss/drop names show up on lots of tiles, so share one copy of each
+            tile = Tile(
+                coordinates=coord,  # same as tile_data['coordinates'], but the shared BOARD_COORDS tuple
+                tile_type=tile_data['tile_type'],
+                drop_source=sys.intern(tile_data['drop_source']),
+                drop=sys.intern(tile_data['drop']),
+                alternative_drop=sys.intern(tile_data['alternative_drop']),
+                count=tile_data['count'],
+                notes=tile_data['notes'],
+                description=sys.intern(tile_data['description']),
+                revealed=tile_data['revealed'],
+            )
+        else:
+            # if no specific tile data is found, create a default tile
+            tile = Tile(coordinates=coord, **DEFAULT_TILE_FIELDS)
+        tiles.append(tile)
+
+    return tiles
 
 def load_dummy_data_from_json(file_path: str) -> None:
-    global teams
+    global teams, teams_by_id, user_team_map
     """
     loads the dummy data from a JSON file and creates teams with boards.
 
@@ -144,7 +337,8 @@ def load_dummy_data_from_json(file_path: str) -> None:
         List[Team]: A list of teams with boards.
     """
     with open(file_path, 'r') as f:
-        tile_data = json.load(f)
+        # every team's board is built from the same data, so index it just the once
+        tile_data = index_tiles_by_coord(json.load(f))
 
     teams = [
         Team(
@@ -165,374 +359,436 @@ def load_dummy_data_from_json(file_path: str) -> None:
         # ),
     ]
 
-    print("Teams loaded:")
+    teams_by_id = {team.id: team for team in teams}
+    user_team_map = {member.discord_id: team for team in teams for member in team.members}
+    _render_cached.cache_clear()
+
+    # bring the fresh boards (and their scores) in line with the loaded move log
+    team_board_dirty.update(teams_by_id)
     for team in teams:
-        print(f"Team {team.id}: {[member.rsn for member in team.members]}")
+        apply_move_log_to_board(team)
+
+    # only build the member lists if someone is actually reading debug output
+    if log.isEnabledFor(logging.DEBUG):
+        for team in teams:
+            log.debug("Team %d: %s", team.id, [member.rsn for member in team.members])
+
+
+# the "READ THIS" instructions tacked onto the end of the kc and loot messages
+_KC_FOOTER = (
+    "📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
+    "Otherwise, track your team's KC progress by filtering to see **{drop_source} KC** in WOM."
+)
+_KC_FOOTER_SHORT = (
+    "📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid OR have killed this boss at any point during this competition, log out to update WOM and, take a screenshot of your starting KC in the collection log before you start.\n\n"
+    "Otherwise, track your team's KC progress by filtering to see **{drop_source} KC** in WOM."
+)
+_LOOT_FOOTER = (
+    "📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
+    "Be sure to turn your loot threshold down so you can see the drops, if necessary."
+)
+_LOOT_FOOTER_SPLIT = (
+    "📖 **READ THIS:** Drops must be visible in your chat box with the event passcode.\n"
+    "Be sure to turn your loot threshold down so you can see the drops, if necessary."
+)
+
+_KC_VARIANTS = (  # kill count tiles
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You venture forth to tile {coord}. There, you encounter an army of {drop_source}s! "
+    "It seems the only way past is by ~~holding hands with~~ banding together with your team and brutally eliminating **{count}** of them. "
+    "Good luck, team! May RNGesus be with you.\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You step into tile {coord}, only to be ambushed by a swarm of {drop_source}s. "
+    "They hiss in unison: 'Only the strongest may pass... after slaying **{count}** of us!'\n\n"
+    "Guess that means it's time for carnage. Good luck, team.\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A battered sign creaks in the wind at tile {coord}. It reads:\n"
+    "“⚔️ **Warning: {drop_source} Territory Ahead! Trespassers Will Be Slain or I Guess Maybe You Need to Slay {count} of Us First.**”\n\n"
+    "What a strange challenge. Fortunately, your team is built different. Get to it!\n\n"
+    + _KC_FOOTER_SHORT,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You descend into a cavern echoing with monstrous shrieks. You've stumbled upon a camp of {drop_source}s — and they're not thrilled to see visitors.\n\n"
+    "To survive, you must cut down **{count}** of the beasts. Or tenderly kiss them. No, probably just kill them. (Maybe both?)\n\n"
+    + _KC_FOOTER_SHORT,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "As your team crosses into tile {coord}, a piercing shriek cuts through the air. "
+    "Suddenly, **{count}** furious {drop_source}s descend from the sky like divebombing pigeons on a bread truck, or Healsha when hole pics are around. "
+    "Time to swat 'em down. Good luck!\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You set foot on tile {coord} and immediately step in something… squishy. "
+    "A pack of **{count}** {drop_source}s erupts from the muck and rushes toward your group with wild abandon. "
+    "Defend yourself!\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "Tile {coord} is eerily quiet... until the ground cracks open beneath your feet, and **{count}** {drop_source}s climb out grinning. "
+    "One of them whispers, 'We have been *waiting* for you.'\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "As you step into tile {coord}, you get goosebumps as you feel something lingering around you. "
+    "Moments later, **{count}** {drop_source}s spawn around with loud POP, POP, POPs. "
+    "Get to slaying!\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You hear battle music start to play... and then spot **{count}** {drop_source}s doing synchronized squats ahead. Look at those peaches!\n\n"
+    "Intimidating. But nothing a little bloodshed won't solve. Move out! Clap 'em!\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A foul stench wafts across tile {coord}. You know it before you see it: "
+    "**{count}** {drop_source}s camped out, ripping ass and sharpening blades. "
+    "Time to clean house.\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "The sky dims as a huge shadow sweeps over tile {coord}. "
+    "Turns out it's just a giant pile of **{count}** {drop_source}s stacked in a trench coat. "
+    "You know what must be done.\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You trip and fall face-first into tile {coord}, only to look up and see **{count}** {drop_source}s grinning down at you. "
+    "They hand you a sword. How polite.\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A nearby sign reads: 'Danger ahead: **{drop_source}s** crossing.' You scoff. "
+    "Then **{count}** of them round the corner, eyes glowing, blades drawn.\n\n"
+    + _KC_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You barely set foot on tile {coord} before a trumpet sounds. "
+    "Out marches a parade of **{count}** {drop_source}s in perfect formation. "
+    "Too bad this isn't a celebration — it's a deathmatch.\n\n"
+    + _KC_FOOTER,
+)
+
+_COLLECTION_VARIANTS = (  # collection tiles
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You venture forth to tile {coord}. You encounter a stinky little troll blocking your path… "
+    "looks a lot like Healsha with a pair of glasses and a mustache on. Curious.\n\n"
+    "The wretched creature demands **{count} {drop}{plural}**{alt} from {drop_source} to be delivered to him before he will let you pass. \n\n"
+    "What a greedy little bastard! Good luck, team!\n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A dusty merchant at tile {coord} eyes you warily. 'I won't let you pass unless you bring me **{count} {drop}{plural}**{alt} from {drop_source}!' he grumbles. \n\n"
+    "Apparently loot is currency now. Good luck getting that trade to go through. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You stumble upon a floating treasure chest sealed shut. An inscription reads: "
+    "'Within me, a key. To unlock me, however, you must bring me **{count} {drop}{plural}**{alt} looted from {drop_source}.'\n\n"
+    "You swear the voice came from inside the box... creepy. \n\n"
+    "In the distance, you see a magical gate sealed shut. We're gonna need that key... Good luck, team! \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A spectral banker blocks the path at tile {coord}. He clutches a dusty ledger and mutters,\n"
+    "“No one passes without presenting **{count} {drop}{plural}**{alt} from {drop_source}....”\n\n"
+    "You suppose it wouldn't hurt bolstering your bank value a bit in the process. Good luck looting, team!\n\n{note_line}\n\n"
+    + _LOOT_FOOTER_SPLIT,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A talking, shirtless frog sits smugly at tile {coord}, croaking:\n"
+    "“No entry unless you bring me **{count} {drop}{plural}**{alt} from {drop_source}!”\n\n"
+    "You're about to ask why it was specified that he was shirtless, but then he does a fancy little dance, charming you into doing whatever he wants without question. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER_SPLIT,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You arrive at tile {coord} and find a sentient cabbage blocking your path. "
+    "It squeaks, 'No passage without **{count} {drop}{plural}**{alt} from {drop_source}!' before rolling slightly closer... menacingly.\n\n"
+    "You didn't think cabbages could be menacing. You were wrong. Good luck. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A cloaked figure looms over tile {coord}. It rasps, 'You want to pass? Bring me **{count} {drop}{plural}**{alt} from {drop_source}, or rot like the others...'\n\n"
+    "A pile of bones lies ominously beside it. Best not join them. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A massive bouncer blocks tile {coord}, arms folded. 'No entry,' he grunts, unless you are carrying **{count} {drop}{plural}**{alt} from {drop_source}.'\n\n"
+    "He's wearing some sick-ass reflective sunglasses and has huge, gorgeous biceps. You blush. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "At tile {coord}, you encounter a haunted vending machine. "
+    "The display flashes: 'Insert **{count} {drop}{plural}**{alt} from {drop_source} to continue.'\n\n"
+    "You're not sure where the slot is, or if it accepts noted items. Either way, good luck, team. I'm sure you'll find the hole. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A dramatic cutscene begins as you enter tile {coord}. A booming narrator shouts:\n"
+    "'ONLY THE WORTHY WHO COLLECT **{count} {drop_upper}{plural_upper}**{alt_upper} FROM {drop_source_upper} SHALL PROCEED!'\n\n"
+    "You try to skip the cutscene but there's no button. Guess you're stuck doing the task. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You discover a giant rubber duck sitting in the middle of tile {coord}. It honks loudly and spits out a note: "
+    "'Quack. Bring **{count} {drop}{plural}**{alt} from {drop_source}. Or else.'\n\n"
+    "You have no idea what 'or else' means coming from this fella, but you're not about to take any chances. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "Tile {coord} reveals a snooty alchemist holding a golden chalice. 'Ah yes,' he sniffs. "
+    "'My potion requires **{count} {drop}{plural}**{alt} from {drop_source}. Be quick about it!'\n\n"
+    "You consider throwing the chalice at him, but that won't get the drops. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A tiny raccoon in a crown is sitting at tile {coord}. He squeaks, 'Prove your worth! Fetch me **{count} {drop}{plural}**{alt} from {drop_source}!' "
+    "Then he throws a peanut at your head.\n\n"
+    "You catch it in your mouth to assert dominance, but quickly realize that chewing on an unshelled peanut isn't pleasant. Better get to work. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You step into tile {coord} and are greeted by a statue that springs to life. 'Halt!' it cries. "
+    "'Bring forth **{count} {drop}{plural}**{alt} from {drop_source}, or remain frozen in time!'\n\n"
+    "Suddenly, 'If I Could Turn Back Time' by Cher starts playing in the distance. Perfect jam to get some drops to. Head out! \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You trip over a magical scroll on tile {coord}. It unfurls itself and reads aloud:\n"
+    "'Retrieve **{count} {drop}{plural}**{alt} from {drop_source}, or suffer mild embarrassment.'\n\n"
+    "Mild embarrassment? Unacceptable. Go get the drops. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+)
+
+_UNIQUE_VARIANTS = (  # unique item tiles
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You venture forth to tile {coord}. Before you lies a vast pit... A booming voice echoes out from it, "
+    "rattling your chest and shaking the trees around you:\n\n"
+    "“**I DEMAND A UNIQUE FROM {drop_source_upper} TO BE PLACED BEFORE MY HOLE. "
+    "BRING IT TO ME AND I SHALL ERECT A BRIDGE FOR YOU TO BE ABLE TO SAFELY TRAVERSE MY HOLE.**”\n\n"
+    "The voice sounds a little bit like Healsha's. That figures, what with the 'hole' and 'erect' descriptors. Well, best be getting to it. \n\n"
+    "Good luck, team!\n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A glowing rift blocks the path at tile {coord}, pulsing with energy like that you've seen from {drop_source}. "
+    "An otherworldly whisper seeps into your mind:\n\n"
+    "“**FEED ME A UNIQUE FROM {drop_source_upper} AND I SHALL OPEN THE WAY.**”\n\n"
+    "It smells like Clodsire droppings around here... You'll need that unique, team. It is too stinky to stay here. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A majestic shrine hums with arcane energy. An ancient voice declares:\n"
+    "“ONLY A **UNIQUE ITEM** FROM {drop_source_upper} SHALL SATISFY THE ALMIGHTY GODS, WHO WILL THEN BENEVOLENTLY ALLOW YOU TO LIVE AND CONTINUE YOUR JOURNEY.”\n\n"
+    "Weird how the gods always demand the rarest stuff. Good luck, team!\n\n{note_line}\n\n"
+    + _LOOT_FOOTER_SPLIT,
+
+    "🎉 `{display_name}` revealed tile **{coord}**.\n\n"
+    "The air crackles with static. A disembodied voice coming from seemingly everywhere around you whispers:\n"
+    "“You wish to proceed? Then, stinky butts, you must offer a **unique** stolen from {drop_source}.”\n\n"
+    "You've been warned. May the RNG gods smile upon you. \n\n{note_line}\n\n"
+    + _LOOT_FOOTER_SPLIT,
+)
+
+_BOMB_VARIANTS = (  # bomb tiles
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "Oho! Well, well, would you look at that. You've stumbled across one of the bombs that Healsha has scattered throughout the world! "
+    "It's up to you to defuse it. Upon further inspection, Healsha left some instructions on how to do just that… That's uncharacteristically kind. \n\n"
+    "The instructions read:\n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "{note_line}",
+
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A pulsing red glow emanates from tile {coord}... it's one of Healsha's infamous bombs! "
+    "A sticky note (literally, it's sticky... hm...) is taped to it: \n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "Damn. Alright. Get to it, team.\n\n{note_line}",
+
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You spot a crate with blinking lights and duct tape that reads: “DO NOT TOUCH.”\n"
+    "You touch it.\n\n"
+    "A note flutters out:\n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "Classic Healsha. Handle with care. \n\n{note_line}",
+
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A suspicious humming noise leads you to a moss-covered barrel... with an LED countdown.\n\n"
+    "Someone (you know who) scribbled instructions on the side:\n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "You've got this. Probably. \n\n{note_line}",
+
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "You find a glowing orb surrounded by runes, crackling with wild energy. Tied to it with twine is a crude, slightly damp label:\n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "Looks like Healsha's handiwork. Smells like Healsha's handiwork. \n\n{note_line}",
+
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "The earth shakes slightly as you arrive. A half-buried, rune-etched sphere pulses ominously in the dirt.\n"
+    "A charred scroll nearby reads:\n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "Defuse it. Or... run? Nah, defuse it. \n\n{note_line}",
+
+    "💣 `{display_name}` revealed tile **{coord}**.\n\n"
+    "A chirping, mechanical sound draws you to tile {coord}. You lift a rock and find a blinking gnome hat.\n"
+    "Attached to it is a sticky note:\n\n"
+    "“**{drop}** — *{description}*”\n\n"
+    "What the hell is this man building? Good luck. \n\n{note_line}",
+)
+
+# message variants for each tile type
+_REVEAL_VARIANTS = {
+    1: _KC_VARIANTS,
+    2: _COLLECTION_VARIANTS,
+    3: _UNIQUE_VARIANTS,
+    "bomb": _BOMB_VARIANTS,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _tile_reveal_fields(
+    coord: str,
+    tile_type: TileType,
+    drop_source: str,
+    drop: str,
+    alternative_drop: str,
+    count: int,
+    notes: str,
+    description: str,
+) -> Dict[str, object]:
+    # everything the templates above can refer to apart from the player's name.
+    # it only depends on the tile, so it's worked out once per tile rather than per reveal
+    alt = f" **OR {alternative_drop}**" if alternative_drop else ""
+    note_line = f"\n📝 **Note:** {notes}" if notes else ""
+    plural = "s" if count > 1 else ""
+    if tile_type == "bomb":
+        note_line = f"\n📖 **READ THIS:** {notes}" if notes else ""
+
+    return {
+        "coord": coord,
+        "drop_source": drop_source,
+        "drop": drop,
+        "count": count,
+        "description": description,
+        "alt": alt,
+        "note_line": note_line,
+        "plural": plural,
+        "drop_source_upper": drop_source.upper(),
+        "drop_upper": drop.upper(),
+        "alt_upper": alt.upper(),
+        "plural_upper": plural.upper(),
+    }
 
-import random
 
 def format_tile_reveal_message(tile: Tile, display_name: str) -> str:
-    coord = f"{tile.coordinates[0]}{tile.coordinates[1]}"
-    
-    # shared helpers
-    alt = f" **OR {tile.alternative_drop}**" if getattr(tile, "alternative_drop", None) else ""
-    note_line = f"\n📝 **Note:** {tile.notes}" if getattr(tile, "notes", None) else ""
-    plural = "s" if getattr(tile, "count", 1) > 1 else ""
-
-    if tile.tile_type == 1:  # kill count tiles
-        variants = [
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You venture forth to tile {coord}. There, you encounter an army of {tile.drop_source}s! "
-            f"It seems the only way past is by ~~holding hands with~~ banding together with your team and brutally eliminating **{tile.count}** of them. "
-            f"Good luck, team! May RNGesus be with you.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You step into tile {coord}, only to be ambushed by a swarm of {tile.drop_source}s. "
-            f"They hiss in unison: 'Only the strongest may pass... after slaying **{tile.count}** of us!'\n\n"
-            f"Guess that means it's time for carnage. Good luck, team.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A battered sign creaks in the wind at tile {coord}. It reads:\n"
-            f"“⚔️ **Warning: {tile.drop_source} Territory Ahead! Trespassers Will Be Slain or I Guess Maybe You Need to Slay {tile.count} of Us First.**”\n\n"
-            f"What a strange challenge. Fortunately, your team is built different. Get to it!\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid OR have killed this boss at any point during this competition, log out to update WOM and, take a screenshot of your starting KC in the collection log before you start.\n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You descend into a cavern echoing with monstrous shrieks. You've stumbled upon a camp of {tile.drop_source}s — and they're not thrilled to see visitors.\n\n"
-            f"To survive, you must cut down **{tile.count}** of the beasts. Or tenderly kiss them. No, probably just kill them. (Maybe both?)\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid OR have killed this boss at any point during this competition, log out to update WOM and, take a screenshot of your starting KC in the collection log before you start.\n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-             f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"As your team crosses into tile {coord}, a piercing shriek cuts through the air. "
-            f"Suddenly, **{tile.count}** furious {tile.drop_source}s descend from the sky like divebombing pigeons on a bread truck, or Healsha when hole pics are around. "
-            f"Time to swat 'em down. Good luck!\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You set foot on tile {coord} and immediately step in something… squishy. "
-            f"A pack of **{tile.count}** {tile.drop_source}s erupts from the muck and rushes toward your group with wild abandon. "
-            f"Defend yourself!\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"Tile {coord} is eerily quiet... until the ground cracks open beneath your feet, and **{tile.count}** {tile.drop_source}s climb out grinning. "
-            f"One of them whispers, 'We have been *waiting* for you.'\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"As you step into tile {coord}, you get goosebumps as you feel something lingering around you. "
-            f"Moments later, **{tile.count}** {tile.drop_source}s spawn around with loud POP, POP, POPs. "
-            f"Get to slaying!\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You hear battle music start to play... and then spot **{tile.count}** {tile.drop_source}s doing synchronized squats ahead. Look at those peaches!\n\n"
-            f"Intimidating. But nothing a little bloodshed won't solve. Move out! Clap 'em!\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A foul stench wafts across tile {coord}. You know it before you see it: "
-            f"**{tile.count}** {tile.drop_source}s camped out, ripping ass and sharpening blades. "
-            f"Time to clean house.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"The sky dims as a huge shadow sweeps over tile {coord}. "
-            f"Turns out it's just a giant pile of **{tile.count}** {tile.drop_source}s stacked in a trench coat. "
-            f"You know what must be done.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You trip and fall face-first into tile {coord}, only to look up and see **{tile.count}** {tile.drop_source}s grinning down at you. "
-            f"They hand you a sword. How polite.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A nearby sign reads: 'Danger ahead: **{tile.drop_source}s** crossing.' You scoff. "
-            f"Then **{tile.count}** of them round the corner, eyes glowing, blades drawn.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You barely set foot on tile {coord} before a trumpet sounds. "
-            f"Out marches a parade of **{tile.count}** {tile.drop_source}s in perfect formation. "
-            f"Too bad this isn't a celebration — it's a deathmatch.\n\n"
-            f"📖 **READ THIS:** If you have *less than 5 KC* of this boss or raid, take a screenshot of your starting KC in the collection log before you start. If you have killed this boss at any point during this competition, EVERYONE must log out to update WOM and then please provide a starting screenshot of the team's WOM overview of that boss/raid's KC data. \n\n"
-            f"Otherwise, track your team's KC progress by filtering to see **{tile.drop_source} KC** in WOM.",
-        ]
-        return random.choice(variants)
-
-    elif tile.tile_type == 2:  # collection tiles
-        variants = [
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You venture forth to tile {coord}. You encounter a stinky little troll blocking your path… "
-            f"looks a lot like Healsha with a pair of glasses and a mustache on. Curious.\n\n"
-            f"The wretched creature demands **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source} to be delivered to him before he will let you pass. \n\n"
-            f"What a greedy little bastard! Good luck, team!\n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A dusty merchant at tile {coord} eyes you warily. 'I won't let you pass unless you bring me **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}!' he grumbles. \n\n"
-            f"Apparently loot is currency now. Good luck getting that trade to go through. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You stumble upon a floating treasure chest sealed shut. An inscription reads: "
-            f"'Within me, a key. To unlock me, however, you must bring me **{tile.count} {tile.drop}{plural}**{alt} looted from {tile.drop_source}.'\n\n"
-            f"You swear the voice came from inside the box... creepy. \n\n"
-            f"In the distance, you see a magical gate sealed shut. We're gonna need that key... Good luck, team! \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A spectral banker blocks the path at tile {coord}. He clutches a dusty ledger and mutters,\n"
-            f"“No one passes without presenting **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}....”\n\n"
-            f"You suppose it wouldn't hurt bolstering your bank value a bit in the process. Good luck looting, team!\n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode.\n"
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A talking, shirtless frog sits smugly at tile {coord}, croaking:\n"
-            f"“No entry unless you bring me **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}!”\n\n"
-            f"You're about to ask why it was specified that he was shirtless, but then he does a fancy little dance, charming you into doing whatever he wants without question. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode.\n"
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-             f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You arrive at tile {coord} and find a sentient cabbage blocking your path. "
-            f"It squeaks, 'No passage without **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}!' before rolling slightly closer... menacingly.\n\n"
-            f"You didn't think cabbages could be menacing. You were wrong. Good luck. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A cloaked figure looms over tile {coord}. It rasps, 'You want to pass? Bring me **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}, or rot like the others...'\n\n"
-            f"A pile of bones lies ominously beside it. Best not join them. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A massive bouncer blocks tile {coord}, arms folded. 'No entry,' he grunts, unless you are carrying **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}.'\n\n"
-            f"He's wearing some sick-ass reflective sunglasses and has huge, gorgeous biceps. You blush. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"At tile {coord}, you encounter a haunted vending machine. "
-            f"The display flashes: 'Insert **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source} to continue.'\n\n"
-            f"You're not sure where the slot is, or if it accepts noted items. Either way, good luck, team. I'm sure you'll find the hole. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A dramatic cutscene begins as you enter tile {coord}. A booming narrator shouts:\n"
-            f"'ONLY THE WORTHY WHO COLLECT **{tile.count} {tile.drop.upper()}{plural.upper()}**{alt.upper()} FROM {tile.drop_source.upper()} SHALL PROCEED!'\n\n"
-            f"You try to skip the cutscene but there's no button. Guess you're stuck doing the task. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You discover a giant rubber duck sitting in the middle of tile {coord}. It honks loudly and spits out a note: "
-            f"'Quack. Bring **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}. Or else.'\n\n"
-            f"You have no idea what 'or else' means coming from this fella, but you're not about to take any chances. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"Tile {coord} reveals a snooty alchemist holding a golden chalice. 'Ah yes,' he sniffs. "
-            f"'My potion requires **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}. Be quick about it!'\n\n"
-            f"You consider throwing the chalice at him, but that won't get the drops. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A tiny raccoon in a crown is sitting at tile {coord}. He squeaks, 'Prove your worth! Fetch me **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}!' "
-            f"Then he throws a peanut at your head.\n\n"
-            f"You catch it in your mouth to assert dominance, but quickly realize that chewing on an unshelled peanut isn't pleasant. Better get to work. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You step into tile {coord} and are greeted by a statue that springs to life. 'Halt!' it cries. "
-            f"'Bring forth **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}, or remain frozen in time!'\n\n"
-            f"Suddenly, 'If I Could Turn Back Time' by Cher starts playing in the distance. Perfect jam to get some drops to. Head out! \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You trip over a magical scroll on tile {coord}. It unfurls itself and reads aloud:\n"
-            f"'Retrieve **{tile.count} {tile.drop}{plural}**{alt} from {tile.drop_source}, or suffer mild embarrassment.'\n\n"
-            f"Mild embarrassment? Unacceptable. Go get the drops. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-        ]
-        return random.choice(variants)
-
-    elif tile.tile_type == 3:  # unique item tiles
-        variants = [
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You venture forth to tile {coord}. Before you lies a vast pit... A booming voice echoes out from it, "
-            f"rattling your chest and shaking the trees around you:\n\n"
-            f"“**I DEMAND A UNIQUE FROM {tile.drop_source.upper()} TO BE PLACED BEFORE MY HOLE. "
-            f"BRING IT TO ME AND I SHALL ERECT A BRIDGE FOR YOU TO BE ABLE TO SAFELY TRAVERSE MY HOLE.**”\n\n"
-            f"The voice sounds a little bit like Healsha's. That figures, what with the 'hole' and 'erect' descriptors. Well, best be getting to it. \n\n"
-            f"Good luck, team!\n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A glowing rift blocks the path at tile {coord}, pulsing with energy like that you've seen from {tile.drop_source}. "
-            f"An otherworldly whisper seeps into your mind:\n\n"
-            f"“**FEED ME A UNIQUE FROM {tile.drop_source.upper()} AND I SHALL OPEN THE WAY.**”\n\n"
-            f"It smells like Clodsire droppings around here... You'll need that unique, team. It is too stinky to stay here. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode. "
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A majestic shrine hums with arcane energy. An ancient voice declares:\n"
-            f"“ONLY A **UNIQUE ITEM** FROM {tile.drop_source.upper()} SHALL SATISFY THE ALMIGHTY GODS, WHO WILL THEN BENEVOLENTLY ALLOW YOU TO LIVE AND CONTINUE YOUR JOURNEY.”\n\n"
-            f"Weird how the gods always demand the rarest stuff. Good luck, team!\n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode.\n"
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-
-            f"🎉 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"The air crackles with static. A disembodied voice coming from seemingly everywhere around you whispers:\n"
-            f"“You wish to proceed? Then, stinky butts, you must offer a **unique** stolen from {tile.drop_source}.”\n\n"
-            f"You've been warned. May the RNG gods smile upon you. \n\n{note_line}\n\n"
-            f"📖 **READ THIS:** Drops must be visible in your chat box with the event passcode.\n"
-            f"Be sure to turn your loot threshold down so you can see the drops, if necessary.",
-        ]
-        return random.choice(variants)
-
-    elif tile.tile_type == "bomb":
-        note_line = f"\n📖 **READ THIS:** {tile.notes}" if getattr(tile, "notes", None) else ""
-
-        variants = [
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"Oho! Well, well, would you look at that. You've stumbled across one of the bombs that Healsha has scattered throughout the world! "
-            f"It's up to you to defuse it. Upon further inspection, Healsha left some instructions on how to do just that… That's uncharacteristically kind. \n\n"
-            f"The instructions read:\n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"{note_line}",
-
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A pulsing red glow emanates from tile {coord}... it's one of Healsha's infamous bombs! "
-            f"A sticky note (literally, it's sticky... hm...) is taped to it: \n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"Damn. Alright. Get to it, team.\n\n{note_line}",
-
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You spot a crate with blinking lights and duct tape that reads: “DO NOT TOUCH.”\n"
-            f"You touch it.\n\n"
-            f"A note flutters out:\n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"Classic Healsha. Handle with care. \n\n{note_line}",
-
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A suspicious humming noise leads you to a moss-covered barrel... with an LED countdown.\n\n"
-            f"Someone (you know who) scribbled instructions on the side:\n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"You've got this. Probably. \n\n{note_line}",
-
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"You find a glowing orb surrounded by runes, crackling with wild energy. Tied to it with twine is a crude, slightly damp label:\n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"Looks like Healsha's handiwork. Smells like Healsha's handiwork. \n\n{note_line}",
-
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"The earth shakes slightly as you arrive. A half-buried, rune-etched sphere pulses ominously in the dirt.\n"
-            f"A charred scroll nearby reads:\n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"Defuse it. Or... run? Nah, defuse it. \n\n{note_line}",
-
-            f"💣 `{display_name}` revealed tile **{coord}**.\n\n"
-            f"A chirping, mechanical sound draws you to tile {coord}. You lift a rock and find a blinking gnome hat.\n"
-            f"Attached to it is a sticky note:\n\n"
-            f"“**{tile.drop}** — *{tile.description}*”\n\n"
-            f"What the hell is this man building? Good luck. \n\n{note_line}",
-        ]
-        return random.choice(variants)
-
-    else:
-        return f"🎉 `{display_name}` revealed tile **{coord}**. (Unrecognized tile type: {tile.tile_type})"
+    coord = tile.coord_str
 
+    variants = _REVEAL_VARIANTS.get(tile.tile_type)
+    if variants is None:
+        return f"🎉 `{display_name}` revealed tile **{coord}**. (Unrecognized tile type: {tile.tile_type})"
 
-def render_board_view(board: List[List[Tile]], team_id: int) -> str:
+    # the message itself is picked at random each time, so only the tile fields are cached
+    fields = dict(_tile_reveal_fields(
+        coord,
+        tile.tile_type,
+        tile.drop_source,
+        tile.drop,
+        tile.alternative_drop,
+        tile.count,
+        tile.notes,
+        tile.description,
+    ))
+    fields["display_name"] = display_name
+
+    return random.choice(variants).format_map(fields)
+
+
+def revealed_mask_for(team_id: int) -> int:
+    mask = _revealed_cache.get(team_id)
+    if mask is None:
+        mask = 0
+        for move in move_log_by_team.get(team_id, ()):
+            index = BOARD_INDEX.get(move.coord)
+            if index is not None:
+                mask |= 1 << index
+        _revealed_cache[team_id] = mask
+    return mask
+
+# what a revealed tile shows on the board and what it's worth, by tile type
+BOARD_CELLS = {
+    1: (" 1️⃣", SCORE_MAP[1]),
+    2: (" 2️⃣", SCORE_MAP[2]),
+    3: (" 3️⃣", SCORE_MAP[3]),
+    "bomb": (" 💣", SCORE_MAP["bomb"]),
+}
+UNREVEALED_CELL = " ⬜"
+
+def render_board_view(board: List[Tile], team_id: int) -> str:
     """
     Returns a formatted string of the bingo board using emojis.
     Includes row (A–G) and column (1–7) headers for reference.
     Takes into account the moves in the move_log to determine revealed tiles.
     """
-    emoji_map = {
-        1: " 1️⃣",
-        2: " 2️⃣",
-        3: " 3️⃣",
-        "bomb": " 💣",
-        "unrevealed": " ⬜",
-    }
-
-    score_map = {
-        1: 1,
-        2: 2,
-        3: 3,
-        "bomb": 4,
-    }
-
     total_score = 0
 
-    # filter the move_log to get moves for the given team
-    team_moves = [move for move in move_log if move.team_id == team_id]
+    # tiles revealed in the move log count as revealed even if the board hasn't been synced
+    revealed_mask = revealed_mask_for(team_id)
 
-    # set the revealed status of tiles based on the move log
-    revealed_coords = set((move.coord[0], move.coord[1]) for move in team_moves)
+    output = [BOARD_HEADER]
 
-    output = ["    1️⃣ 2️⃣ 3️⃣ 4️⃣ 5️⃣ 6️⃣ 7️⃣"]  # column headers using number emojis
+    # locals are quicker to look up than module globals inside the loop
+    board_cells = BOARD_CELLS
+    unrevealed = UNREVEALED_CELL
 
-    for row_index, row in enumerate(board):
-        row_label = chr(ord("A") + row_index)
-        row_str = f"{row_label}  "  # row label
-        for tile in row:
-            coord = (tile.coordinates[0], tile.coordinates[1])
-
-            if coord in revealed_coords:
-                tile.revealed = True  # set the tile as revealed if it's in the move log
-
-            if not tile.revealed:
-                row_str += emoji_map["unrevealed"]
+    for row_label, row_start in zip(ROW_LETTERS, range(0, 49, 7)):
+        row_parts = [f"{row_label}  "]  # row label
+        for index in range(row_start, row_start + 7):
+            tile = board[index]
+            if not (tile.revealed or revealed_mask >> index & 1):
+                row_parts.append(unrevealed)
             else:
-                row_str += emoji_map[tile.tile_type]
-                total_score += score_map[tile.tile_type]
-        output.append(row_str)
+                emoji, points = board_cells[tile.tile_type]
+                row_parts.append(emoji)
+                total_score += points
+        output.append("".join(row_parts))
 
-    output.append(f"\n🏆 ** Total Team Points: {total_score} **")
+    output.append("")  # blank line before the total
+    output.append(f"🏆 ** Total Team Points: {total_score} **")
 
     return "\n".join(output)
 
+@functools.lru_cache(maxsize=64)
+def _render_cached(team_id: int, version: int) -> str:
+    return render_board_view(teams_by_id[team_id].board, team_id)
+
+def render_team_board(team: Team) -> str:
+    """
+    Same output as render_board_view for a team's board, but reuses the last
+    render until one of the team's tiles changes.
+    """
+    return _render_cached(team.id, board_version[team.id])
+
 def apply_move_log_to_board(team):
+    # nothing to do if the board already matches the move log
+    if team.id not in team_board_dirty:
+        return
+
     # reset all tiles
-    for row in team.board:
-        for tile in row:
-            tile.revealed = False
-
-    # apply moves relevant to this team
-    for move in move_log:
-        if move.team_id == team.id:
-            tile = get_tile(team.board, move.coord)
-            if tile:
-                tile.revealed = True
\ No newline at end of file
+    for tile in team.board:
+        tile.revealed = False
+    team_score[team.id] = 0
+    team_bombs[team.id] = 0
+
+    # apply this team's moves (already bucketed by team, so no scan over everyone's moves)
+    board = team.board
+    for move in move_log_by_team.get(team.id, ()):
+        # same lookup as get_tile, inlined since this runs for every move on load
+        index = BOARD_INDEX.get(move.coord)
+        if index is not None:
+            set_revealed(team, board[index], True)
+
+    board_version[team.id] += 1
+    team_board_dirty.discard(team.id)